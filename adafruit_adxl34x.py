@@ -28,12 +28,12 @@ Implementation Notes
 
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
 """
-from struct import unpack
+from time import sleep
 from micropython import const
 from adafruit_bus_device import i2c_device
 
 try:
-    from typing import Tuple, Dict
+    from typing import Tuple, Dict, List, Optional
 
     # This is only needed for typing
     import busio
@@ -47,6 +47,7 @@ _ADXL345_DEFAULT_ADDRESS: int = const(0x53)  # Assumes ALT address pin low
 # Conversion factors
 _ADXL345_MG2G_MULTIPLIER: float = 0.004  # 4mg per lsb
 _STANDARD_GRAVITY: float = 9.80665  # earth standard gravity
+_SCALE: float = _ADXL345_MG2G_MULTIPLIER * _STANDARD_GRAVITY  # m/s^2 per lsb
 
 _REG_DEVID: int = const(0x00)  # Device ID
 _REG_THRESH_TAP: int = const(0x1D)  # Tap threshold
@@ -83,6 +84,16 @@ _INT_DOUBLE_TAP: int = const(0b00100000)  # DOUBLE_TAP bit
 _INT_ACT: int = const(0b00010000)  # ACT bit
 _INT_INACT: int = const(0b00001000)  # INACT bit
 _INT_FREE_FALL: int = const(0b00000100)  # FREE_FALL  bit
+_INT_KEEP_NO_TAP: int = const(0b10011111)  # All bits but SINGLE_TAP and DOUBLE_TAP
+_DATA_FORMAT_KEEP: int = const(0xF0)  # DATA_FORMAT bits untouched when setting range
+_FULL_RES: int = const(0x08)  # FULL_RES bit
+_FIFO_MAX_ENTRIES: int = const(33)  # 32 FIFO entries plus the output registers
+
+# Fixed register writes, prebuilt as (register, value) packets
+_POWER_ON: bytes = bytes((_REG_POWER_CTL, 0x08))  # set the 'measure' bit
+_INT_DISABLE: bytes = bytes((_REG_INT_ENABLE, 0x00))  # disable all interrupts
+_ACT_XYZ: bytes = bytes((_REG_ACT_INACT_CTL, 0b01110000))  # activity on X, Y, Z
+_TAP_XYZ: bytes = bytes((_REG_TAP_AXES, 0b00000111))  # tap on X, Y, Z
 
 
 class DataRate:  # pylint: disable=too-few-public-methods
@@ -145,12 +156,33 @@ class Range:  # pylint: disable=too-few-public-methods
     RANGE_2_G: int = const(0b00)  # +/- 2g (default value)
 
 
-class ADXL345:
+class FIFOMode:  # pylint: disable=too-few-public-methods
+    """An enum-like class representing the possible FIFO modes.
+
+    Possible values are:
+
+    - ``FIFOMode.BYPASS``
+    - ``FIFOMode.FIFO``
+    - ``FIFOMode.STREAM``
+    - ``FIFOMode.TRIGGER``
+
+    """
+
+    BYPASS: int = const(0b00)  # FIFO is bypassed (default value)
+    FIFO: int = const(0b01)  # Collect up to 32 samples, then stop
+    STREAM: int = const(0b10)  # Hold the last 32 samples, discarding the oldest
+    TRIGGER: int = const(0b11)  # Stream until a trigger event, then stop
+
+
+class ADXL345:  # pylint: disable=too-many-public-methods
     """Driver for the ADXL345 3 axis accelerometer
 
     :param ~busio.I2C i2c: The I2C bus the ADXL345 is connected to.
     :param int address: The I2C device address for the sensor. Default is :const:`0x53`.
 
+    The sensor is not probed for when the driver is created, so a missing or miswired
+    sensor shows up as an error from the first register access instead.
+
     **Quickstart: Importing and using the device**
 
         Here is an example of using the :class:`ADXL345` class.
@@ -178,11 +210,18 @@ class ADXL345:
     """
 
     def __init__(self, i2c: busio.I2C, address: int = _ADXL345_DEFAULT_ADDRESS):
-        self._i2c = i2c_device.I2CDevice(i2c, address)
-        self._buffer = bytearray(6)
+        # skip the probe; the init writes below are the first bus traffic anyway
+        self._i2c = i2c_device.I2CDevice(i2c, address, probe=False)
+        self._buffer = bytearray(8)
+        self._mv = memoryview(self._buffer)
+        self._fifo_buffer = None
+        self._fifo_mv = None
         # set the 'measure' bit in to enable measurement
-        self._write_register_byte(_REG_POWER_CTL, 0x08)
-        self._write_register_byte(_REG_INT_ENABLE, 0x0)
+        self._write_packet(_POWER_ON)
+        self._write_packet(_INT_DISABLE)
+        # remember the rate and format registers so they never need to be read back
+        self._bw_rate = self._read_register_byte(_REG_BW_RATE)
+        self._data_format = self._read_register_byte(_REG_DATA_FORMAT)
 
         self._enabled_interrupts = {}
         self._event_status = {}
@@ -190,26 +229,51 @@ class ADXL345:
     @property
     def acceleration(self) -> Tuple[int, int, int]:
         """The x, y, z acceleration values returned in a 3-tuple in :math:`m / s ^ 2`"""
-        x, y, z = unpack("<hhh", self._read_register(_REG_DATAX0, 6))
-        x = x * _ADXL345_MG2G_MULTIPLIER * _STANDARD_GRAVITY
-        y = y * _ADXL345_MG2G_MULTIPLIER * _STANDARD_GRAVITY
-        z = z * _ADXL345_MG2G_MULTIPLIER * _STANDARD_GRAVITY
+        return self.read_accel()
+
+    def read_accel(self) -> Tuple[float, float, float]:
+        """
+        Read the x, y, z acceleration values, returned in a 3-tuple in :math:`m / s ^ 2`.
+
+        The same as :attr:`acceleration`, but as a plain method call it avoids the
+        property lookup, which is noticeable on CircuitPython in tight polling loops.
+        """
+        scale = _SCALE
+        buf = self._read_data_registers()
+        x = buf[0] | (buf[1] << 8)
+        x -= 0x10000 if x & 0x8000 else 0
+        y = buf[2] | (buf[3] << 8)
+        y -= 0x10000 if y & 0x8000 else 0
+        z = buf[4] | (buf[5] << 8)
+        z -= 0x10000 if z & 0x8000 else 0
+        return x * scale, y * scale, z * scale
+
+    @property
+    def raw_acceleration(self) -> Tuple[int, int, int]:
+        """The raw x, y, z values returned in a 3-tuple, in counts of 4mg"""
+        buf = self._read_data_registers()
+        x = buf[0] | (buf[1] << 8)
+        x -= 0x10000 if x & 0x8000 else 0
+        y = buf[2] | (buf[3] << 8)
+        y -= 0x10000 if y & 0x8000 else 0
+        z = buf[4] | (buf[5] << 8)
+        z -= 0x10000 if z & 0x8000 else 0
         return x, y, z
 
     @property
     def raw_x(self) -> int:
         """The raw x value."""
-        return unpack("<h", self._read_register(_REG_DATAX0, 2))[0]
+        return self._read_raw_axis(_REG_DATAX0)
 
     @property
     def raw_y(self) -> int:
         """The raw y value."""
-        return unpack("<h", self._read_register(_REG_DATAY0, 2))[0]
+        return self._read_raw_axis(_REG_DATAY0)
 
     @property
     def raw_z(self) -> int:
         """The raw z value."""
-        return unpack("<h", self._read_register(_REG_DATAZ0, 2))[0]
+        return self._read_raw_axis(_REG_DATAZ0)
 
     @property
     def events(self) -> Dict[str, bool]:
@@ -234,8 +298,65 @@ class ADXL345:
 
         """
 
-        interrupt_source_register = self._read_clear_interrupt_source()
+        return self._update_event_status(self._read_clear_interrupt_source())
+
+    def read_all(self) -> Tuple[Tuple[float, float, float], Dict[str, bool]]:
+        """
+        Read the acceleration and the event status while holding the I2C bus once.
+
+        Returns a 2-tuple of the :attr:`acceleration` tuple and the :attr:`events`
+        dictionary. Both come from a single I2C read, halving the bus traffic per loop
+        compared to reading the two attributes separately::
+
+            acceleration, events = accelerometer.read_all()
+
+        """
+        scale = _SCALE
+        # INT_SOURCE, DATA_FORMAT, then DATAX0 to DATAZ1
+        buf = self._read_status_and_data_registers()
+        x = buf[2] | (buf[3] << 8)
+        x -= 0x10000 if x & 0x8000 else 0
+        y = buf[4] | (buf[5] << 8)
+        y -= 0x10000 if y & 0x8000 else 0
+        z = buf[6] | (buf[7] << 8)
+        z -= 0x10000 if z & 0x8000 else 0
+
+        return (x * scale, y * scale, z * scale), self._update_event_status(buf[0])
+
+    def read_status_and_acceleration(self) -> Tuple[bool, Tuple[float, float, float]]:
+        """
+        Read the tap status and the acceleration in a single I2C read.
+
+        Returns a 2-tuple of whether a tap was detected, as for the ``tap`` key of
+        :attr:`events`, and the :attr:`acceleration` tuple::
+
+            tapped, acceleration = accelerometer.read_status_and_acceleration()
+
+        """
+        acceleration, events = self.read_all()
+        return events.get("tap", False), acceleration
+
+    def read_interrupt_sources(self, count: int, interval: float) -> bytearray:
+        """
+        Read the interrupt source register ``count`` times, ``interval`` seconds apart.
+
+        :param int count: The number of reads.
+        :param float interval: The time to wait between reads, in seconds. The I2C bus\
+        is released while waiting.
 
+        Returns a bytearray of the raw register values, one byte per read. Each read
+        clears the latched events, so byte ``i`` holds the events flagged since the
+        read before it, roughly ``i * interval`` seconds after the first read. The
+        timing is only as accurate as ``time.sleep``.
+        """
+        sources = bytearray(count)
+        for i in range(count):
+            if i:
+                sleep(interval)
+            sources[i] = self._read_register_byte(_REG_INT_SOURCE)
+        return sources
+
+    def _update_event_status(self, interrupt_source_register: int) -> Dict[str, bool]:
         self._event_status.clear()
 
         for event_type, value in self._enabled_interrupts.items():
@@ -272,13 +393,11 @@ class ADXL345:
             accelerometer.enable_motion_detection(threshold=20)
 
         """
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE)
 
-        self._write_register_byte(_REG_INT_ENABLE, 0x0)  # disable interrupts for setup
-        self._write_register_byte(
-            _REG_ACT_INACT_CTL, 0b01110000
-        )  # enable activity on X,Y,Z
-        self._write_register_byte(_REG_THRESH_ACT, threshold)
+        self._write_packet(_INT_DISABLE)  # disable interrupts for setup
+        self._write_packet(_ACT_XYZ)  # enable activity on X,Y,Z
+        self._write_register_byte(_REG_THRESH_ACT, threshold & 0xFF)
         self._write_register_byte(_REG_INT_ENABLE, _INT_ACT)  # Inactive interrupt only
 
         active_interrupts |= _INT_ACT
@@ -289,7 +408,7 @@ class ADXL345:
         """
         Disable motion detection
         """
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE)
         active_interrupts &= ~_INT_ACT
         self._write_register_byte(_REG_INT_ENABLE, active_interrupts)
         self._enabled_interrupts.pop("motion")
@@ -314,11 +433,10 @@ class ADXL345:
 
        """
 
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE)
 
-        self._write_register_byte(_REG_INT_ENABLE, 0x0)  # disable interrupts for setup
-        self._write_register_byte(_REG_THRESH_FF, threshold)
-        self._write_register_byte(_REG_TIME_FF, time)
+        self._write_packet(_INT_DISABLE)  # disable interrupts for setup
+        self._write_register_bytes(_REG_THRESH_FF, threshold & 0xFF, time & 0xFF)
 
         # add FREE_FALL to the active interrupts and set them to re-enable
         active_interrupts |= _INT_FREE_FALL
@@ -327,7 +445,7 @@ class ADXL345:
 
     def disable_freefall_detection(self) -> None:
         """Disable freefall detection"""
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE)
         active_interrupts &= ~_INT_FREE_FALL
         self._write_register_byte(_REG_INT_ENABLE, active_interrupts)
         self._enabled_interrupts.pop("freefall")
@@ -367,22 +485,23 @@ class ADXL345:
             accelerometer.enable_tap_detection(duration=30, threshold=25)
 
         """
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE)
 
-        self._write_register_byte(_REG_INT_ENABLE, 0x0)  # disable interrupts for setup
-        self._write_register_byte(
-            _REG_TAP_AXES, 0b00000111
-        )  # enable X, Y, Z axes for tap
-        self._write_register_byte(_REG_THRESH_TAP, threshold)
-        self._write_register_byte(_REG_DUR, duration)
+        self._write_packet(_INT_DISABLE)  # disable interrupts for setup
+        self._write_packet(_TAP_XYZ)  # enable X, Y, Z axes for tap
+        self._write_register_byte(_REG_THRESH_TAP, threshold & 0xFF)
 
         if tap_count == 1:
+            self._write_register_byte(_REG_DUR, duration & 0xFF)
+
             active_interrupts |= _INT_SINGLE_TAP
             self._write_register_byte(_REG_INT_ENABLE, active_interrupts)
             self._enabled_interrupts["tap"] = 1
         elif tap_count == 2:
-            self._write_register_byte(_REG_LATENT, latency)
-            self._write_register_byte(_REG_WINDOW, window)
+            # DUR, LATENT and WINDOW are consecutive, so set them in one write
+            self._write_register_bytes(
+                _REG_DUR, duration & 0xFF, latency & 0xFF, window & 0xFF
+            )
 
             active_interrupts |= _INT_DOUBLE_TAP
             self._write_register_byte(_REG_INT_ENABLE, active_interrupts)
@@ -392,42 +511,120 @@ class ADXL345:
 
     def disable_tap_detection(self) -> None:
         """Disable tap detection"""
-        active_interrupts = self._read_register_unpacked(_REG_INT_ENABLE)
-        active_interrupts &= ~_INT_SINGLE_TAP
-        active_interrupts &= ~_INT_DOUBLE_TAP
+        active_interrupts = self._read_register_byte(_REG_INT_ENABLE) & _INT_KEEP_NO_TAP
         self._write_register_byte(_REG_INT_ENABLE, active_interrupts)
         self._enabled_interrupts.pop("tap")
 
     @property
     def data_rate(self) -> int:
         """The data rate of the sensor."""
-        rate_register = self._read_register_unpacked(_REG_BW_RATE)
-        return rate_register & 0x0F
+        return self._bw_rate & 0x0F
 
     @data_rate.setter
     def data_rate(self, val: int) -> None:
-        self._write_register_byte(_REG_BW_RATE, val)
+        self._bw_rate = val & 0xFF
+        self._write_register_byte(_REG_BW_RATE, self._bw_rate)
 
     @property
     def range(self) -> int:
         """The measurement range of the sensor."""
-        range_register = self._read_register_unpacked(_REG_DATA_FORMAT)
-        return range_register & 0x03
+        return self._data_format & 0x03
 
     @range.setter
     def range(self, val: int) -> None:
-        # read the current value of the data format register
-        format_register = self._read_register_unpacked(_REG_DATA_FORMAT)
+        # clear the bottom 4 bits of the cached data format register, set the
+        # range and make sure that the FULL-RES bit is enabled for range scaling
+        self._data_format = (
+            (self._data_format & _DATA_FORMAT_KEEP) | _FULL_RES | (val & 0x03)
+        )
+        self._write_register_byte(_REG_DATA_FORMAT, self._data_format)
+
+    def configure_fifo(
+        self,
+        mode: int = FIFOMode.STREAM,
+        samples: int = 31,
+        *,
+        trigger_int2: bool = False
+    ) -> None:
+        """
+        Set up the on-chip FIFO so samples can be collected and read in bulk with
+        `read_fifo`.
+
+        :param int mode: The FIFO mode, one of the `FIFOMode` values.
+
+        :param int samples: The number of samples (0 to 31) that sets the watermark\
+        interrupt in ``FIFO`` and ``STREAM`` modes, or the number of samples kept from\
+        before the trigger in ``TRIGGER`` mode.
+
+        :param bool trigger_int2: (trigger mode only) Link the trigger event to INT2\
+        rather than INT1.
+
+        """
+        if not 0 <= samples <= 31:
+            raise ValueError("samples must be between 0 and 31")
+        fifo_control = (mode & 0x03) << 6 | samples
+        if trigger_int2:
+            fifo_control |= 0x20
+        self._write_register_byte(_REG_FIFO_CTL, fifo_control)
+
+    @property
+    def fifo_entries(self) -> int:
+        """The number of samples waiting to be read from the FIFO."""
+        return self._read_register_byte(_REG_FIFO_STATUS) & 0x3F
+
+    def read_fifo(self, count: Optional[int] = None) -> memoryview:
+        """
+        Drain samples from the FIFO while holding the I2C bus once.
+
+        :param int count: The number of samples to read. Defaults to the number of\
+        entries currently in the FIFO.
 
-        # clear the bottom 4 bits and update the data rate
-        format_register &= ~0x0F
-        format_register |= val
+        Returns the samples as read from the chip, oldest first: 6 bytes per sample
+        holding the x, y, z values as little-endian signed 16-bit raw counts. Keeping
+        them packed is cheapest for logging or sending them on; convert them to
+        :math:`m / s ^ 2` with `decode_samples` when needed. The returned view is reused
+        by the next call. The FIFO must first be enabled with `configure_fifo`.
+        """
+        if count is not None and not 0 <= count <= _FIFO_MAX_ENTRIES:
+            raise ValueError("count must be between 0 and %d" % _FIFO_MAX_ENTRIES)
+        if self._fifo_buffer is None:
+            self._fifo_buffer = bytearray(6 * _FIFO_MAX_ENTRIES)
+            self._fifo_mv = memoryview(self._fifo_buffer)
+        buf = self._buffer
+        fifo = self._fifo_buffer
+        with self._i2c as i2c:
+            if count is None:
+                buf[0] = _REG_FIFO_STATUS
+                i2c.write_then_readinto(buf, buf, out_end=1, in_end=1)
+                count = buf[0] & 0x3F
+            # every read of the data registers pops the next FIFO entry
+            buf[0] = _REG_DATAX0
+            for start in range(0, 6 * count, 6):
+                i2c.write_then_readinto(
+                    buf, fifo, out_end=1, in_start=start, in_end=start + 6
+                )
+        return self._fifo_mv[: 6 * count]
 
-        # Make sure that the FULL-RES bit is enabled for range scaling
-        format_register |= 0x08
+    @staticmethod
+    def decode_samples(buffer) -> List[Tuple[float, float, float]]:
+        """
+        Convert a buffer of packed samples, as read from the data registers, into a list
+        of x, y, z acceleration 3-tuples in :math:`m / s ^ 2`.
 
-        # write the updated values
-        self._write_register_byte(_REG_DATA_FORMAT, format_register)
+        :param buffer: A bytes-like object holding 6 bytes per sample, such as the\
+        result of `read_fifo`.
+        """
+        scale = _SCALE
+        samples = []
+        for start in range(0, len(buffer) - 5, 6):
+            x = buffer[start] | (buffer[start + 1] << 8)
+            x -= 0x10000 if x & 0x8000 else 0
+            y = buffer[start + 2] | (buffer[start + 3] << 8)
+            y -= 0x10000 if y & 0x8000 else 0
+            z = buffer[start + 4] | (buffer[start + 5] << 8)
+            z -= 0x10000 if z & 0x8000 else 0
+            samples.append((x * scale, y * scale, z * scale))
+        return samples
 
     @property
     def offset(self) -> Tuple[int, int, int]:
@@ -436,35 +633,71 @@ class ADXL345:
 
         See offset_calibration example for usage.
         """
-        x_offset, y_offset, z_offset = unpack("<bbb", self._read_register(_REG_OFSX, 3))
+        buf = self._read_register(_REG_OFSX, 3)
+        x_offset = buf[0] - 0x100 if buf[0] & 0x80 else buf[0]
+        y_offset = buf[1] - 0x100 if buf[1] & 0x80 else buf[1]
+        z_offset = buf[2] - 0x100 if buf[2] & 0x80 else buf[2]
         return x_offset, y_offset, z_offset
 
     @offset.setter
     def offset(self, val: Tuple[int, int, int]) -> None:
         x_offset, y_offset, z_offset = val
-        self._write_register_byte(_REG_OFSX, x_offset)
-        self._write_register_byte(_REG_OFSY, y_offset)
-        self._write_register_byte(_REG_OFSZ, z_offset)
+        # OFSX, OFSY and OFSZ are consecutive, so set them in one write
+        self._write_register_bytes(
+            _REG_OFSX, x_offset & 0xFF, y_offset & 0xFF, z_offset & 0xFF
+        )
 
     def _read_clear_interrupt_source(self) -> int:
-        return self._read_register_unpacked(_REG_INT_SOURCE)
+        return self._read_register_byte(_REG_INT_SOURCE)
+
+    def _read_raw_axis(self, register: int) -> int:
+        buf = self._read_register(register, 2)
+        value = buf[0] | (buf[1] << 8)
+        return value - 0x10000 if value & 0x8000 else value
 
-    def _read_register_unpacked(self, register: int) -> int:
-        return unpack("<b", self._read_register(register, 1))[0]
+    def _read_register_byte(self, register: int) -> int:
+        self._buffer[0] = register
+        with self._i2c as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=1)
+        return self._buffer[0]
 
-    def _read_register(self, register: int, length: int) -> int:
-        self._buffer[0] = register & 0xFF
+    def _read_data_registers(self) -> memoryview:
+        self._buffer[0] = _REG_DATAX0
         with self._i2c as i2c:
-            i2c.write(self._buffer, start=0, end=1)
-            i2c.readinto(self._buffer, start=0, end=length)
-            return self._buffer[0:length]
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=6)
+        return self._mv
+
+    def _read_register(self, register: int, length: int) -> memoryview:
+        self._buffer[0] = register
+        with self._i2c as i2c:
+            i2c.write_then_readinto(
+                self._buffer, self._buffer, out_end=1, in_end=length
+            )
+        return self._mv[:length]
+
+    def _read_status_and_data_registers(self) -> memoryview:
+        self._buffer[0] = _REG_INT_SOURCE
+        with self._i2c as i2c:
+            i2c.write_then_readinto(self._buffer, self._buffer, out_end=1, in_end=8)
+        return self._mv
 
     def _write_register_byte(self, register: int, value: int) -> None:
-        self._buffer[0] = register & 0xFF
-        self._buffer[1] = value & 0xFF
+        self._buffer[0] = register
+        self._buffer[1] = value
         with self._i2c as i2c:
             i2c.write(self._buffer, start=0, end=2)
 
+    def _write_register_bytes(self, register: int, *values: int) -> None:
+        # the register address auto-increments for each value written
+        self._buffer[0] = register
+        self._buffer[1 : len(values) + 1] = bytes(values)
+        with self._i2c as i2c:
+            i2c.write(self._buffer, start=0, end=len(values) + 1)
+
+    def _write_packet(self, packet: bytes) -> None:
+        with self._i2c as i2c:
+            i2c.write(packet)
+
 
 class ADXL343(ADXL345):
     """
@@ -0,0 +1,28 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+import time
+import board
+import adafruit_adxl34x
+
+i2c = board.I2C()  # uses board.SCL and board.SDA
+# i2c = board.STEMMA_I2C()  # For using the built-in STEMMA QT connector on a microcontroller
+
+# For ADXL343
+accelerometer = adafruit_adxl34x.ADXL343(i2c)
+# For ADXL345
+# accelerometer = adafruit_adxl34x.ADXL345(i2c)
+
+accelerometer.data_rate = adafruit_adxl34x.DataRate.RATE_100_HZ
+# keep the most recent samples in the on-chip FIFO
+accelerometer.configure_fifo(adafruit_adxl34x.FIFOMode.STREAM)
+
+while True:
+    # let the FIFO fill up, then read everything it holds in one go
+    time.sleep(0.25)
+    raw_samples = accelerometer.read_fifo()
+    # convert the packed raw counts only when we need them in m/s^2
+    samples = accelerometer.decode_samples(raw_samples)
+    print("Read %d samples" % len(samples))
+    for sample in samples:
+        print("%f %f %f" % sample)
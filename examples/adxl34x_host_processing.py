@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host-side processing for ADXL34x samples
+
+Helpers for analysing accelerometer samples once they have been forwarded
+from a board to a computer running CPython, for example over USB serial.
+This is not for use on CircuitPython boards and is not installed with the
+library; copy it next to your host script and import it from there.
+
+Requires NumPy (https://numpy.org) and Numba (https://numba.pydata.org).
+"""
+from typing import Dict
+
+import numpy as np
+from numba import njit, prange
+
+# Matches the driver's conversion: 4mg per lsb times earth standard gravity
+_SCALE = np.float32(0.004 * 9.80665)
+
+# Interrupt source register bits, matching the driver
+_INT_SINGLE_TAP = 0b01000000
+_INT_DOUBLE_TAP = 0b00100000
+_INT_ACT = 0b00010000
+_INT_FREE_FALL = 0b00000100
+
+
+def raw_samples(buffer) -> np.ndarray:
+    """
+    View a buffer of packed samples, as read from the ADXL34x data registers or
+    returned by :meth:`adafruit_adxl34x.ADXL345.read_fifo`, as raw counts.
+
+    :param buffer: A bytes-like object holding 6 bytes per sample.
+
+    Returns an (N, 3) int16 array of x, y, z raw counts sharing memory with ``buffer``.
+    No copy is made: for the result of ``read_fifo`` the array is a writable view of
+    the driver's FIFO buffer and is overwritten by the next read, so take a ``copy()``
+    to keep it. The kernels below only read their input and return new float arrays,
+    so the counts can be passed to them directly.
+    """
+    raw = np.frombuffer(buffer, dtype="<i2", count=len(buffer) // 6 * 3)
+    return raw.reshape(-1, 3)
+
+
+def decode_samples(buffer) -> np.ndarray:
+    """
+    Convert a buffer of packed samples, as read from the ADXL34x data registers,
+    into acceleration values in one vectorized step.
+
+    :param buffer: A bytes-like object holding 6 bytes per sample.
+
+    Returns an (N, 3) float32 array of x, y, z acceleration in :math:`m / s ^ 2`.
+    """
+    return raw_samples(buffer).astype(np.float32) * _SCALE
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def apply_offset(samples: np.ndarray, offset: np.ndarray) -> np.ndarray:
+    """
+    Subtract a per-axis bias from every sample.
+
+    :param ~numpy.ndarray samples: An (N, 3) array of x, y, z samples, which may be\
+    raw int16 counts.
+    :param ~numpy.ndarray offset: The x, y, z bias to remove, in the same units\
+    as ``samples``. It may be fractional.
+
+    Returns a new (N, 3) float64 array; ``samples`` is left untouched, so it is safe to
+    pass a view of the driver's FIFO buffer.
+    """
+    corrected = np.empty((samples.shape[0], 3), dtype=np.float64)
+    for i in prange(samples.shape[0]):  # pylint: disable=not-an-iterable
+        corrected[i, 0] = samples[i, 0] - offset[0]
+        corrected[i, 1] = samples[i, 1] - offset[1]
+        corrected[i, 2] = samples[i, 2] - offset[2]
+    return corrected
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def moving_average(samples: np.ndarray, window: int) -> np.ndarray:
+    """
+    Smooth each axis with a moving average.
+
+    :param ~numpy.ndarray samples: An (N, 3) array of x, y, z samples.
+    :param int window: The number of samples to average over.
+
+    Returns an (N - window + 1, 3) array where each row is the mean of ``window``
+    consecutive input rows.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    count = samples.shape[0] - window + 1
+    averaged = np.empty((max(count, 0), 3), dtype=np.float64)
+    if count <= 0:
+        return averaged
+    for axis in prange(3):  # pylint: disable=not-an-iterable
+        total = 0.0
+        for i in range(window):
+            total += samples[i, axis]
+        averaged[0, axis] = total / window
+        for i in range(1, count):
+            total += samples[i + window - 1, axis] - samples[i - 1, axis]
+            averaged[i, axis] = total / window
+    return averaged
+
+
+@njit(cache=True)
+def tap_detect(axis: np.ndarray, threshold: float, duration: int) -> np.ndarray:
+    """
+    Find taps on one axis.
+
+    :param ~numpy.ndarray axis: A one dimensional array of samples from a single axis.
+    :param float threshold: The magnitude a sample must exceed to count towards a tap.
+    :param int duration: The number of consecutive samples that must exceed\
+    ``threshold`` to register a tap.
+
+    Returns an array of the indices at which each tap was registered. A tap is only
+    reported once however long the axis stays above ``threshold``.
+    """
+    if duration < 1:
+        raise ValueError("duration must be at least 1")
+    taps = np.empty(axis.shape[0], dtype=np.int64)
+    count = 0
+    run = 0
+    for i in range(axis.shape[0]):
+        if abs(axis[i]) > threshold:
+            run += 1
+            if run == duration:
+                taps[count] = i
+                count += 1
+        else:
+            run = 0
+    return taps[:count]
+
+
+def poll_events(accelerometer, count: int, interval: float) -> Dict[str, np.ndarray]:
+    """
+    Poll the interrupt source register ``count`` times, ``interval`` seconds apart,
+    and find the polls at which each kind of event was flagged.
+
+    :param ~adafruit_adxl34x.ADXL345 accelerometer: The sensor to poll.
+    :param int count: The number of times to read the interrupt source register.
+    :param float interval: The time between reads, in seconds.
+
+    Returns a dictionary mapping ``tap``, ``double_tap``, ``motion`` and ``freefall``
+    to arrays of poll indices. Index ``i`` means the event happened between polls
+    ``i - 1`` and ``i``, about ``i * interval`` seconds after polling started.
+    """
+    sources = np.frombuffer(
+        accelerometer.read_interrupt_sources(count, interval), dtype=np.uint8
+    )
+    return {
+        "tap": np.flatnonzero(sources & _INT_SINGLE_TAP),
+        "double_tap": np.flatnonzero(sources & _INT_DOUBLE_TAP),
+        "motion": np.flatnonzero(sources & _INT_ACT),
+        "freefall": np.flatnonzero(sources & _INT_FREE_FALL),
+    }
@@ -18,7 +18,9 @@ accelerometer.enable_tap_detection()
 # accelerometer.enable_tap_detection(tap_count=2,threshold=20, duration=50)
 
 while True:
-    print("%f %f %f" % accelerometer.acceleration)
+    # read the tap status and the acceleration in one go
+    tapped, acceleration = accelerometer.read_status_and_acceleration()
+    print("%f %f %f" % acceleration)
 
-    print("Tapped: %s" % accelerometer.events["tap"])
+    print("Tapped: %s" % tapped)
     time.sleep(0.5)